@@ -9,6 +9,9 @@ Public API
 modify_k_params(kfile_in, kfile_out=None, repl=…)
     Patch *label,value* rows inside any LS-DYNA *.k* file.
 
+KParamPatcher(repl)
+    Precompiled patcher for applying the same *repl* to many *.k* files.
+
 extract_nodout(nodout, *, field="z_disp", …)
     Pure line-number extractor (with optional physical-time resampling).
 
@@ -31,7 +34,7 @@ from importlib import metadata
 # ------------------------------------------------------------------
 # Re-export public helpers from sub-modules
 # ------------------------------------------------------------------
-from .kfile import modify_k_params           # noqa: F401
+from .kfile import KParamPatcher, modify_k_params   # noqa: F401
 from .nodout import extract_nodout           # noqa: F401
 from .runner import Tee, run_lsdyna, run_lsdyna_batch   # noqa: F401
 
@@ -47,6 +50,7 @@ except metadata.PackageNotFoundError:              # pragma: no cover
 # What gets imported by `from lsdyna_utils import *`
 # ------------------------------------------------------------------
 __all__ = [
+    "KParamPatcher",
     "modify_k_params",
     "extract_nodout",
     "run_lsdyna",
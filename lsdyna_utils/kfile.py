@@ -3,9 +3,14 @@ Author : Rong Jin, University of Kentucky
 Date   : 07-08-2025
 File   : kfile.py – minimal helper for patching LS-DYNA keyword (*.k) files
 
-This module exposes one public function
----------------------------------------
+This module exposes
+-------------------
+KParamPatcher(repl)
+    • Precompiled *label,value* patcher – build once, apply to many
+      files (the regex/encoding cost is amortized across the batch).
+
 modify_k_params(kfile_in, kfile_out=None, repl={})
+    • One-shot convenience wrapper around :class:`KParamPatcher`.
     • Replaces the numeric value of specific *labels* in a *.k file.
     • Works on any line that looks like:   LABEL , value
       (     comma separates label and value, anything after the first
@@ -17,13 +22,114 @@ Typical usage
 >>> from lsdyna_utils.kfile import modify_k_params
 >>> modify_k_params("Run.k", "Run_mod.k",
 ...                 {"RC1": 0.0025, "RD41": 0.35, "RG": 1.155})
+
+>>> from lsdyna_utils.kfile import KParamPatcher
+>>> patcher = KParamPatcher({"RC1": 0.0025, "RD41": 0.35})
+>>> for k in Path("Ensembles").rglob("*.k"):
+...     patcher.apply(k, k.with_suffix(".mod.k"))
 """
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 from typing import Mapping, Sequence
 
+# IO chunk size – big enough to amortize syscalls, small enough that
+# peak memory stays constant no matter how large the *.k file is.
+_CHUNK = 1 << 20
+
+
+def _compile_pattern(pairs: Mapping[bytes, float]) -> re.Pattern[bytes]:
+    """One alternation regex matching any *label , value* row of *pairs*.
+
+    The regex engine skips non-matching lines in C at memory-bandwidth
+    speed; the dict look-up happens only on real hits.  Longest labels
+    first so a label never shadows a longer sibling (``RC1`` vs ``RC10``).
+    """
+    alt = b"|".join(re.escape(k) for k in sorted(pairs, key=len, reverse=True))
+    return re.compile(rb"^[ \t]*(" + alt + rb")[ \t]*,.*$", re.MULTILINE)
+
+
+class KParamPatcher:
+    """
+    Reusable *label,value* patcher for LS-DYNA keyword files.
+
+    Compiling the alternation regex and encoding the labels happens once
+    at construction, so patching thousands of ensemble files pays the
+    set-up cost a single time:
+
+    >>> patcher = KParamPatcher({"RC1": 0.0025, "RD41": 0.35})
+    >>> for k in files:
+    ...     patcher.apply(k, k.with_suffix(".mod.k"))
+    """
+
+    def __init__(
+        self,
+        repl: Mapping[str, float] | Sequence[tuple[str, float]] = (),
+    ) -> None:
+        # Pre-encoded for the binary fast path: keyword files are ASCII;
+        # staying in bytes skips the str decode of every chunk and
+        # halves the per-chunk allocations.
+        self._pairs: dict[bytes, float] = {
+            str(k).encode(): v for k, v in dict(repl).items()
+        }
+        self._pattern = _compile_pattern(self._pairs) if self._pairs else None
+
+    def _patch(self, m: re.Match[bytes]) -> bytes:
+        label = m.group(1)
+        # Format new value (scientific notation, 4 decimals)
+        return label + b"," + (b"%.4e" % self._pairs[label])
+
+    def apply(
+        self,
+        kfile_in: str | Path,
+        kfile_out: str | Path | None = None,
+    ) -> Path:
+        """Patch *kfile_in* → *kfile_out* (in-place when *kfile_out* is None).
+
+        Returns the path of the file that was written.
+        """
+        pattern = self._pattern
+
+        # --- Decide where to write the output -----------------------------
+        out_path = Path(kfile_out or kfile_in)  # overwrite if None
+        # Explicit output == input must route through the temp file too,
+        # or opening the output would truncate the input mid-read.
+        in_place = (
+            kfile_out is None
+            or out_path.resolve() == Path(kfile_in).resolve()
+        )
+        # In-place: patch into a sibling temp file, then atomically swap it
+        # in – a crash mid-write never corrupts the original.
+        tmp_path = (
+            out_path.with_name(out_path.name + ".tmp") if in_place else out_path
+        )
+
+        # --- Stream input → output in newline-aligned chunks --------------
+        # Only ~1 MiB lives in memory at a time; the regex still sees whole
+        # lines because the carried-over tail always starts at a line start.
+        with open(kfile_in, "rb", buffering=_CHUNK) as fin, \
+             open(tmp_path, "wb", buffering=_CHUNK) as fout:
+            tail = b""
+            while True:
+                chunk = fin.read(_CHUNK)
+                if not chunk:
+                    break
+                chunk = tail + chunk
+                cut = chunk.rfind(b"\n") + 1
+                tail = chunk[cut:]
+                body = chunk[:cut]
+                fout.write(pattern.sub(self._patch, body) if pattern else body)
+            if tail:                          # final line without newline
+                fout.write(pattern.sub(self._patch, tail) if pattern else tail)
+
+        if in_place:
+            os.replace(tmp_path, out_path)
+
+        return out_path
+
 
 def modify_k_params(
     kfile_in: str | Path,
@@ -33,6 +139,10 @@ def modify_k_params(
     """
     Replace the value of *label,value* rows in an LS-DYNA *.k file.
 
+    One-shot wrapper around :class:`KParamPatcher` – when patching many
+    files with the same *repl*, build the patcher once and call
+    :meth:`KParamPatcher.apply` instead.
+
     Parameters
     ----------
     kfile_in
@@ -60,31 +170,4 @@ def modify_k_params(
       significant digits (``%.4e``) – tweak the format string if a
       different precision is required.
     """
-    # --- Normalise replacements to a plain dict for O(1) look-up ----------
-    pairs: dict[str, float] = dict(repl)
-
-    # --- Read the entire file into a list of strings ----------------------
-    with open(kfile_in, "r") as fh:
-        lines: list[str] = fh.readlines()
-
-    # --- Scan & patch lines in-memory ------------------------------------
-    for idx, line in enumerate(lines):
-        if "," not in line:
-            # Skip lines that clearly cannot be “LABEL,value”
-            continue
-
-        # Split only once – anything after the first comma belongs to value
-        label, _ = [frag.strip() for frag in line.split(",", maxsplit=1)]
-
-        if label in pairs:
-            # Format new value (scientific notation, 4 decimals)
-            new_val = f"{pairs[label]:.4e}"
-            lines[idx] = f"{label},{new_val}\n"
-
-    # --- Decide where to write the output ---------------------------------
-    out_path = Path(kfile_out or kfile_in)  # overwrite if None
-
-    with open(out_path, "w") as fh:
-        fh.writelines(lines)
-
-    return out_path
+    return KParamPatcher(repl).apply(kfile_in, kfile_out)
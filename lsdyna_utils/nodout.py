@@ -16,6 +16,12 @@ extract_nodout(nodout, *, field="z_disp", start_line=…, …)
 
 from __future__ import annotations
 
+import io
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Literal, Sequence
 
@@ -47,23 +53,263 @@ _FIELDS: list[str] = [
 # ────────────────────────────────────────────────────────────────
 # Internal helpers
 # ────────────────────────────────────────────────────────────────
+# Field → fixed-width slice, computed once at import instead of a
+# list.index() walk inside every extraction call.
+_SLICE: dict[str, slice] = {
+    "nodal_point": slice(0, _BYTE0),
+    **{
+        f: slice(_BYTE0 + (i - 1) * _BYTEW, _BYTE0 + i * _BYTEW)
+        for i, f in enumerate(_FIELDS)
+        if i > 0
+    },
+}
+
+
 def _slice_pos(field: _Field) -> slice:
-    """Fixed-width slice location for *field*."""
-    if field == "nodal_point":
-        return slice(0, _BYTE0)
-    idx = _FIELDS.index(field)
-    start = _BYTE0 + (idx - 1) * _BYTEW
-    return slice(start, start + _BYTEW)
+    """Fixed-width slice location for *field* (one dict look-up)."""
+    return _SLICE[field]
+
+
+# Width-preserving repair: consume one leading space, re-emit the
+# mantissa with an 'e' before the exponent sign.  A digit must sit
+# directly before the sign, so standard '1.2e+03' cells never match.
+_FORTRAN_SUB = re.compile(rb" ([^ \x00]*\d)([+-]\d+)")
+
+
+def _fix_exponent_packed(flat: np.ndarray) -> np.ndarray | None:
+    """Single-regex repair over the packed column buffer.
+
+    Trades each cell's leading space for the inserted 'e', so the cell
+    width – and therefore the S-dtype layout – survives one C-level
+    ``re.sub`` over ``flat.tobytes()``.  Returns *None* when some cell
+    has no leading space to trade (caller uses the np.char chain).
+    """
+    flat = np.ascontiguousarray(flat)
+    width = flat.dtype.itemsize
+    cells = flat.view("S1").reshape(-1, width)
+    if not (cells[:, 0] == b" ").all():
+        return None
+    fixed = _FORTRAN_SUB.sub(rb"\1e\2", flat.tobytes())
+    if len(fixed) != flat.size * width:     # a cell matched unexpectedly
+        return None
+    return np.frombuffer(fixed, dtype=f"S{width}")
+
 
+def _fix_exponent_array(raw: np.ndarray) -> np.ndarray:
+    """Insert 'e' into mantissa/exponent values that come without it.
 
-def _fix_scientific(s: str) -> str:
-    """Insert 'e' if a mantissa/exponent string comes without it."""
-    if "e" in s.lower():
+    Works on a whole S-dtype array at once: one width-preserving regex
+    pass over the packed buffer when every cell has a leading space to
+    trade, else a C-level ``np.char`` chain.  Values that already carry
+    an 'e'/'E' pass through untouched.
+    """
+    packed = _fix_exponent_packed(raw.ravel())
+    if packed is not None:
+        return packed
+    s = np.char.strip(raw)
+    need = np.char.find(np.char.lower(s), b"e") < 0
+    if not need.any():
         return s
-    for i in range(1, len(s)):
-        if s[i] in "+-":
-            return f"{s[:i]}e{s[i:]}"
-    return s
+    sub = s[need]
+    neg = np.char.startswith(sub, b"-")        # remember the mantissa sign …
+    body = np.char.lstrip(sub, b"+-")          # … so it survives the replace
+    body = np.char.replace(body, b"-", b"e-")
+    body = np.char.replace(body, b"+", b"e+")
+    # Widen by one byte – the inserted 'e' must not be truncated away.
+    out = s.astype(f"S{s.dtype.itemsize + 1}")
+    out[need] = np.where(neg, np.char.add(b"-", body), body)
+    return out
+
+
+def _line_starts(buf) -> tuple[np.ndarray, np.ndarray]:
+    """Byte offset of every line start in *buf* plus its content length.
+
+    Returns ``(starts, avail)`` where ``avail[i]`` is the number of bytes
+    on line *i* (trailing newline excluded).
+    """
+    chars = np.frombuffer(buf, dtype="S1")
+    starts = np.concatenate(([0], np.flatnonzero(chars == b"\n") + 1))
+    if starts[-1] >= len(buf):          # file ends with '\n'
+        starts = starts[:-1]
+    ends = np.append(starts[1:], len(buf))
+    avail = ends - starts
+    avail[chars[np.minimum(ends - 1, len(buf) - 1)] == b"\n"] -= 1
+    return starts, avail
+
+
+# A digit directly followed by a sign and another digit only happens in
+# Fortran-style exponents ('1.2340-003'); standard notation always has
+# an 'e'/'E' before the sign.
+_FORTRAN_EXP = re.compile(rb"\d[+-]\d")
+
+# Line-offset table of the most recently scanned file, keyed by
+# (path, size, mtime_ns).  Extracting several fields from the same
+# nodout repeats the newline scan – the only remaining full-file pass –
+# verbatim, so one cached entry covers the common loop.
+_STARTS_CACHE: dict[tuple[str, int, int], tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _line_starts_cached(
+    buf, key: tuple[str, int, int] | None
+) -> tuple[np.ndarray, np.ndarray]:
+    if key is None:
+        return _line_starts(buf)
+    hit = _STARTS_CACHE.get(key)
+    if hit is None:
+        _STARTS_CACHE.clear()           # keep exactly one file cached
+        hit = _STARTS_CACHE[key] = _line_starts(buf)
+    return hit
+
+
+def _parse_values(raw: np.ndarray) -> np.ndarray:
+    """Convert an S-dtype column array to float64.
+
+    The direct ``astype`` runs in a single C loop; only if the file uses
+    Fortran-style exponents without an 'e' do we pay for the vectorized
+    repair pass.  A digit-sign-digit sniff on the first few values picks
+    the right order up front, so Fortran files skip the doomed full-column
+    ``astype`` attempt.
+    """
+    if raw.size == 0:
+        return np.asarray([])
+    flat = raw.ravel()
+    if _FORTRAN_EXP.search(flat[:64].tobytes()):
+        return _fix_exponent_array(flat).astype(np.float64).reshape(raw.shape)
+    try:
+        out = flat.astype(np.float64)
+    except ValueError:
+        out = _fix_exponent_array(flat).astype(np.float64)
+    return out.reshape(raw.shape)
+
+
+# Gather at least this many column bytes before a process pool pays for
+# the fork + pickle overhead (~64 MiB of selected data).
+_PARALLEL_MIN_BYTES = 1 << 26
+
+
+def _advise_sequential(fh, mm: mmap.mmap) -> None:
+    """Tell the kernel this is one sequential scan (bigger readahead,
+    earlier page drop).  Both hints are Linux/POSIX-only no-ops elsewhere.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+
+def _gather_column(
+    buf, offsets: np.ndarray, col: slice, line_len: int | None = None
+) -> np.ndarray:
+    """Parse the *col* bytes of every line in *offsets*.
+
+    When the file is strictly uniform (*line_len* given), the buffer is
+    reinterpreted through a structured dtype whose ``val`` field *is*
+    the column – a zero-copy view, so selecting a line's value is a
+    pointer bump instead of a per-byte gather.
+    """
+    width = col.stop - col.start
+    if line_len is not None:
+        row_dt = np.dtype(
+            [
+                ("_pre", f"V{col.start}"),
+                ("val", f"S{width}"),
+                ("_post", f"V{line_len - col.stop}"),
+            ]
+        )
+        rows = np.frombuffer(buf, dtype=row_dt)
+        return _parse_values(rows["val"][offsets // line_len])
+
+    chars = np.frombuffer(buf, dtype="S1")
+    sel = offsets[..., None] + np.arange(col.start, col.stop)
+    raw = np.ascontiguousarray(chars[sel]).view(f"S{width}")[..., 0]
+    return _parse_values(raw)
+
+
+def _gather_column_worker(
+    path: Path,
+    offsets: np.ndarray,
+    col_start: int,
+    col_stop: int,
+    line_len: int | None,
+) -> np.ndarray:
+    """Process-pool worker: re-mmap *path* (pages are shared) and parse."""
+    with open(path, "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        _advise_sequential(fh, mm)
+        return _gather_column(mm, offsets, slice(col_start, col_stop), line_len)
+
+
+def _block_offsets(
+    buf,
+    col: slice,
+    start_line: int,
+    line_offset: int,
+    range_length: int,
+    cache_key: tuple[str, int, int] | None = None,
+) -> tuple[np.ndarray | None, int | None]:
+    """Byte offset of every requested line, shape ``(n_blocks, range_length)``.
+
+    Builds the line-offset table once and fancy-indexes it – no per-line
+    Python objects.  Returns ``(offsets, line_len)`` where *line_len* is
+    the uniform line width (newline included) when every line in the
+    file shares it, else *None*.  ``(None, None)`` means some requested
+    line is too short for *col* (caller falls back to the per-line
+    parser).
+    """
+    starts, avail = _line_starts_cached(buf, cache_key)
+
+    n_lines = starts.size
+    n_blocks = (n_lines - (start_line + range_length - 1)) // line_offset + 1
+    if n_blocks <= 0:
+        return np.empty((0, range_length), dtype=np.int64), None
+
+    line_idx = (
+        (start_line - 1)
+        + line_offset * np.arange(n_blocks)[:, None]
+        + np.arange(range_length)[None, :]
+    )
+    if int(avail[line_idx].min()) < col.stop:
+        return None, None               # ragged lines – not fixed-width
+
+    line_len = None
+    if avail.min() == avail.max() and n_lines * (int(avail[0]) + 1) == len(buf):
+        line_len = int(avail[0]) + 1    # strictly uniform file
+
+    return starts[line_idx], line_len
+
+
+def _gather_offsets(
+    buf,
+    offsets: np.ndarray,
+    col: slice,
+    path: Path,
+    line_len: int | None = None,
+) -> np.ndarray:
+    """Parse the *col* values of *offsets*, fanning out for huge gathers.
+
+    Above ``_PARALLEL_MIN_BYTES`` of selected data the offset rows are
+    split across a process pool; each worker mmaps the same file, so
+    the page cache is shared.
+    """
+    if offsets.size == 0:
+        return np.asarray([])
+    # Never hand a worker an empty slab: wide files can trip the byte
+    # threshold with fewer blocks than cores.
+    n_workers = min(os.cpu_count() or 1, offsets.shape[0])
+    if n_workers > 1 and offsets.size * (col.stop - col.start) >= _PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            parts = pool.map(
+                _gather_column_worker,
+                repeat(path),
+                np.array_split(offsets, n_workers),
+                repeat(col.start),
+                repeat(col.stop),
+                repeat(line_len),
+            )
+            return np.vstack(list(parts))
+
+    return _gather_column(buf, offsets, col, line_len)
 
 
 # ────────────────────────────────────────────────────────────────
@@ -77,6 +323,8 @@ def extract_nodout(
     start_line: int,
     line_offset: int,
     range_length: int,
+    # ---- optional node filter ----
+    node_ids: Sequence[int] | None = None,
     # ---- optional physical-time resampling ----
     node_num: int | None = None,
     total_time: float | None = None,
@@ -87,6 +335,7 @@ def extract_nodout(
     # ---- outputs ----
     save_csv: str | Path | None = None,
     save_txt: str | Path | None = None,
+    save_npy: str | Path | None = None,
 ) -> np.ndarray:
     """
     Extract *field* from a nodout file that has **no** “time=” headers.
@@ -96,6 +345,13 @@ def extract_nodout(
     ▶ Provide ``start_line``, ``line_offset``, ``range_length`` ➜ return
       array shape ``(n_blocks, range_length)``.
 
+    Node filter
+    -----------
+    ▶ ``node_ids`` keeps only the listed nodes (in file order).  Their
+      positions are read from the **first** block's id column once and
+      reused for every block – node order is constant in nodout output.
+      With resampling, ``n_extract`` then counts the *kept* nodes.
+
     Mode 2 (line numbers + physical-time resampling)
     -----------------------------------------------
     ▶ Additionally provide
@@ -105,34 +361,19 @@ def extract_nodout(
 
     Output
     ------
-    • ``save_csv``  – writes comma-separated file (NumPy ``delimiter=","``).  
-    • ``save_txt``  – writes space-separated plain text.  
-    • Pass neither to skip file output, or pass both to save twice.
+    • ``save_csv``  – writes comma-separated file (NumPy ``delimiter=","``).
+    • ``save_txt``  – writes space-separated plain text.
+    • ``save_npy``  – writes binary ``.npy`` (no formatting cost,
+      much faster and smaller than text for large arrays).
+    • Pass none to skip file output, or several to save multiple times
+      (csv + txt share one formatting pass).
     """
     # 0) sanity checks
     if field not in _FIELDS:
         raise ValueError(f"field={field!r} invalid – choose one of {_FIELDS}")
 
-    col = _slice_pos(field)
-    path = Path(nodout).resolve()
-
-    # 1) Basic line-number extraction → arr shape (n_blocks, range_length)
-    with open(path, "r") as fh:
-        lines = fh.readlines()
-
-    blocks: list[list[float]] = []
-    cur = start_line
-    while cur + range_length - 1 <= len(lines):
-        vals = [
-            float(_fix_scientific(lines[i][col].strip()))
-            for i in range(cur - 1, cur + range_length - 1)
-        ]
-        blocks.append(vals)
-        cur += line_offset
-    arr = np.asarray(blocks)
-
-    # 2) Optional physical-time resampling
-    if total_time is not None:
+    resample = total_time is not None
+    if resample:
         required = [node_num, start_rt_value, rt_step, num_time_steps, n_extract]
         if any(v is None for v in required):
             raise ValueError(
@@ -142,19 +383,104 @@ def extract_nodout(
         if node_num != range_length:
             raise ValueError("node_num must equal range_length.")
 
+    col = _slice_pos(field)
+    path = Path(nodout).resolve()
+
+    # 1) Basic line-number extraction → arr shape (n_blocks, range_length)
+    #    The file is mmap'ed, not read: no per-line str objects, no copy
+    #    of the whole file into the heap – the OS page cache is the only
+    #    working set, and the kernel can prefetch sequentially.
+    st = path.stat()
+    if st.st_size == 0:
+        arr = np.asarray([])
+    else:
+        with open(path, "rb") as fh, mmap.mmap(
+            fh.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            _advise_sequential(fh, mm)
+            offsets, line_len = _block_offsets(
+                mm, col, start_line, line_offset, range_length,
+                cache_key=(str(path), st.st_size, st.st_mtime_ns),
+            )
+
+            if offsets is None:
+                # Ragged lines – fall back to the per-line slicer, but
+                # still parse the collected column in one vectorized go.
+                lines = mm[:].decode().splitlines()
+                blocks: list[list[str]] = []
+                cur = start_line
+                while cur + range_length - 1 <= len(lines):
+                    blocks.append(
+                        [lines[i][col] for i in range(cur - 1, cur + range_length - 1)]
+                    )
+                    cur += line_offset
+                arr = _parse_values(np.asarray(blocks, dtype="S"))
+                if node_ids is not None and arr.size:
+                    id_slc = _slice_pos("nodal_point")
+                    first_ids = np.asarray([
+                        int(lines[i][id_slc])
+                        for i in range(start_line - 1, start_line - 1 + range_length)
+                    ])
+                    arr = arr[:, np.flatnonzero(np.isin(first_ids, node_ids))]
+            else:
+                if node_ids is not None and offsets.size:
+                    # Node positions are constant across blocks: parse the
+                    # id column of the first block only and keep those
+                    # column positions everywhere.
+                    first_ids = _gather_column(
+                        mm, offsets[:1], _slice_pos("nodal_point"), line_len
+                    ).ravel().astype(np.int64)
+                    keep = np.flatnonzero(np.isin(first_ids, node_ids))
+                    offsets = offsets[:, keep]
+                if resample:
+                    # Prune *before* parsing: only the resampled blocks
+                    # (and only their first n_extract nodes) are ever
+                    # gathered from the mmap.
+                    n_blocks = offsets.shape[0]
+                    dt = total_time / (n_blocks - 1) if n_blocks > 1 else total_time
+                    idx_start = round(start_rt_value / dt)
+                    idx_step  = round(rt_step / dt)
+                    row_idx = idx_start + idx_step * np.arange(
+                        num_time_steps, dtype=np.int64
+                    )
+                    if row_idx.size and row_idx[-1] >= n_blocks:
+                        raise IndexError(
+                            f"Resampling needs block {int(row_idx[-1])} but the "
+                            f"file only holds {n_blocks} blocks."
+                        )
+                    offsets = offsets[row_idx, :n_extract]
+                    resample = False          # already applied
+                arr = _gather_offsets(mm, offsets, col, path, line_len)
+
+    # 2) Physical-time resampling (per-line fallback path only – the
+    #    vectorized path prunes the block offsets before parsing)
+    if resample:
         dt = total_time / (arr.shape[0] - 1) if arr.shape[0] > 1 else total_time
         idx_start = round(start_rt_value / dt)
         idx_step  = round(rt_step / dt)
 
-        arr = np.vstack([
-            arr[idx_start + k * idx_step, : n_extract]
-            for k in range(num_time_steps)  # type: ignore[arg-type]
-        ])
+        # One fancy index instead of num_time_steps temporaries + vstack.
+        row_idx = idx_start + idx_step * np.arange(num_time_steps, dtype=np.int64)
+        if row_idx.size and row_idx[-1] >= arr.shape[0]:
+            raise IndexError(
+                f"Resampling needs block {int(row_idx[-1])} but the "
+                f"file only holds {arr.shape[0]} blocks."
+            )
+        arr = arr[row_idx, : n_extract]
 
     # 3) Optional file output(s)
-    if save_csv:
+    if save_npy:
+        np.save(save_npy, arr)
+    if save_csv and save_txt:
+        # Format once – the two text flavours differ only in delimiter.
+        buf = io.StringIO()
+        np.savetxt(buf, arr, delimiter=",", fmt="%.6e")
+        text = buf.getvalue()
+        Path(save_csv).write_text(text)
+        Path(save_txt).write_text(text.replace(",", " "))
+    elif save_csv:
         np.savetxt(save_csv, arr, delimiter=",", fmt="%.6e")
-    if save_txt:
+    elif save_txt:
         np.savetxt(save_txt, arr, delimiter=" ", fmt="%.6e")
 
     return arr
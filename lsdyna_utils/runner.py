@@ -27,8 +27,13 @@ Typical usage
 
 from __future__ import annotations
 
+import contextlib
+import os
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Iterable, Iterator, Sequence, TextIO
@@ -58,27 +63,36 @@ class Tee:
 
     def __init__(self, path: str | Path, mode: str = "w", encoding: str = "utf-8"):
         self._file: TextIO = open(path, mode, encoding=encoding)
-        self._stdout: TextIO = subprocess.sys.stdout  # type: ignore[attr-defined]
+        self._stdout: TextIO = sys.stdout
+        self._lock = threading.Lock()          # writes may come from any thread
+        self._redirect = contextlib.ExitStack()
 
     def write(self, msg: str) -> None:  # called by print(…)
-        self._stdout.write(msg)
-        self._file.write(msg)
+        with self._lock:
+            self._stdout.write(msg)
+            self._file.write(msg)
 
     def flush(self) -> None:
-        self._stdout.flush()
-        self._file.flush()
+        with self._lock:
+            self._stdout.flush()
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the log file (for use as a plain sink, without entering)."""
+        self._file.close()
 
     # --------------------------------------------------------------
     # context-manager API
     # --------------------------------------------------------------
     def __enter__(self) -> "Tee":
-        subprocess.sys.stdout = self  # type: ignore[assignment]
-        subprocess.sys.stderr = self  # mirror stderr too
+        # redirect_stdout/-stderr restore the previous streams on exit
+        # even when several Tees nest – no bare `sys.stdout =` swap.
+        self._redirect.enter_context(contextlib.redirect_stdout(self))
+        self._redirect.enter_context(contextlib.redirect_stderr(self))
         return self
 
     def __exit__(self, exc_type, exc, tb) -> bool:  # noqa: D401
-        subprocess.sys.stdout = self._stdout  # type: ignore[assignment]
-        subprocess.sys.stderr = self._stdout  # restore both
+        self._redirect.close()
         self._file.close()
         return False
 
@@ -104,6 +118,68 @@ def _build_cmd(
     return cmd
 
 
+# ----------------------------------------------------------------------
+# Helper 2 – Popen with live tee of both pipes
+# ----------------------------------------------------------------------
+def _run_teed(
+    cmd: Sequence[str],
+    cwd: Path,
+    tee: str | Path,
+    *,
+    timeout: int | None,
+    check: bool,
+) -> CompletedProcess:
+    """Run *cmd*, duplicating stdout/stderr live to terminal + *tee* file.
+
+    Unlike ``subprocess.run(capture_output=True)``, the pipes are
+    drained line-by-line by two background threads while the solver is
+    still running – the tee really is live, and a chatty multi-hour job
+    never buffers gigabytes before the first byte reaches the log.
+    """
+    sink = Tee(tee)
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            text=True,
+            bufsize=1,                       # line-buffered pipes
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        def _drain(pipe: TextIO, collected: list[str]) -> None:
+            for line in pipe:
+                sink.write(line)
+                collected.append(line)
+
+        out_lines: list[str] = []
+        err_lines: list[str] = []
+        readers = [
+            threading.Thread(target=_drain, args=(proc.stdout, out_lines)),
+            threading.Thread(target=_drain, args=(proc.stderr, err_lines)),
+        ]
+        for t in readers:
+            t.start()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            for t in readers:
+                t.join()
+    finally:
+        sink.close()
+
+    stdout, stderr = "".join(out_lines), "".join(err_lines)
+    if check and returncode:
+        raise subprocess.CalledProcessError(
+            returncode, cmd, output=stdout, stderr=stderr
+        )
+    return CompletedProcess(cmd, returncode, stdout, stderr)
+
+
 # ----------------------------------------------------------------------
 # Single-job launcher
 # ----------------------------------------------------------------------
@@ -151,7 +227,9 @@ def run_lsdyna(
     """
     kfile = Path(kfile).resolve()
     cwd_path = Path(cwd or kfile.parent).resolve()
-    executable = Path(executable).expanduser().resolve()
+    executable = Path(executable)
+    if not executable.is_absolute():   # already-resolved paths skip the stat()s
+        executable = executable.expanduser().resolve()
 
     cmd = _build_cmd(executable, kfile, ncpu, memory, dump_file)
 
@@ -159,15 +237,7 @@ def run_lsdyna(
         raise ValueError("`tee=` only makes sense when capture_output=True")
 
     if tee:
-        with Tee(tee):
-            return subprocess.run(
-                cmd,
-                cwd=cwd_path,
-                text=True,
-                capture_output=capture_output,
-                timeout=timeout,
-                check=check,
-            )
+        return _run_teed(cmd, cwd_path, tee, timeout=timeout, check=check)
 
     return subprocess.run(
         cmd,
@@ -185,7 +255,7 @@ def run_lsdyna(
 def run_lsdyna_batch(
     kfiles: Iterable[str | Path],
     *,
-    max_workers: int = 8,
+    max_workers: int | None = None,
     **kwargs,
 ) -> Iterator[tuple[Path, int]]:
     """
@@ -194,9 +264,12 @@ def run_lsdyna_batch(
     Parameters
     ----------
     kfiles
-        Iterable of *.k* paths.
+        Iterable of *.k* paths – consumed lazily, so arbitrarily large
+        batches never build a full future dict up front.
     max_workers
-        Number of threads (IO-bound, so threads are fine).
+        Number of concurrent jobs.  Defaults to
+        ``cpu_count // ncpu`` so the solver threads of all running jobs
+        together saturate – but do not oversubscribe – the machine.
     **kwargs
         Forwarded verbatim to :pyfunc:`run_lsdyna`.
 
@@ -204,13 +277,29 @@ def run_lsdyna_batch(
     ------
     ``(kfile_path, return_code)``  as each job completes.
     """
-    kpaths: list[Path] = [Path(k).resolve() for k in kfiles]
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // int(kwargs.get("ncpu", 1)))
+
+    # Resolve the executable once for the whole batch – on NFS every
+    # resolve() is a stat() per path component, per job.
+    kwargs["executable"] = (
+        Path(kwargs.get("executable", DEFAULT_EXECUTABLE)).expanduser().resolve()
+    )
 
     def _worker(p: Path) -> tuple[Path, int]:
         proc = run_lsdyna(p, **kwargs)
         return p, proc.returncode
 
+    # Sliding window: keep at most *max_workers* jobs in flight and pull
+    # the next kfile only when a slot frees up.  No resolve() here –
+    # run_lsdyna resolves each kfile exactly once.
+    it = (Path(k) for k in kfiles)
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        futures = {pool.submit(_worker, p): p for p in kpaths}
-        for fut in as_completed(futures):
-            yield fut.result()
+        in_flight = {pool.submit(_worker, p) for p in islice(it, max_workers)}
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                nxt = next(it, None)
+                if nxt is not None:
+                    in_flight.add(pool.submit(_worker, nxt))
+                yield fut.result()